@@ -25,7 +25,6 @@ from gui.startup.widgets.shutter_bar import ShutterBar
 from gui.startup.widgets.gif_button import GifButton
 from gui.startup.camera.preview import CameraPreviewThread
 from gui.qt_logging import QtSignalingHandler, install_qt_logger
-from gui.widgets.error_popup import ErrorToast
 
 # Theme 
 from gui.theme.theme_vars import theme_vars
@@ -279,13 +278,10 @@ class StartupWindow(BaseFramelessWindow):
         msg = log_entry["msg"]
         exc = log_entry.get("exc")
 
-        popup = ErrorToast(self, level=level, message=msg, traceback=exc)
+        # Only needed once something is logged; keeps it off the startup path
+        from gui.widgets.error_popup import show_error
 
-        geo = self.geometry()
-        x = geo.x() + (geo.width() - popup.width()) // 2
-        y = geo.y() + (geo.height() - popup.height()) // 2
-        popup.move(x, y)
-        popup.show()
+        show_error(self, level=level, message=msg, traceback=exc, center_in=self.geometry())
 
     def _load_last_photo(self):
         try:
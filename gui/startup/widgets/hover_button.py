@@ -0,0 +1,28 @@
+from PySide6.QtWidgets import QPushButton
+from PySide6.QtCore import Signal
+
+class HoverButton(QPushButton):
+    """
+    A QPushButton that reports a status text while hovered.
+    Emits `hovered` with its text on enter and "" on leave.
+    """
+    hovered = Signal(str)
+
+    def __init__(self, hover_text="", parent=None):
+        super().__init__(parent)
+        self._hover_text = hover_text
+
+    def hoverText(self):
+        return self._hover_text
+
+    def setHoverText(self, text):
+        self._hover_text = text
+
+    # --- Event Overrides for Hover Status ---
+    def enterEvent(self, event):
+        self.hovered.emit(self._hover_text)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.hovered.emit("")
+        super().leaveEvent(event)
@@ -1,17 +1,86 @@
 # gui/startup/widgets/shutter_bar.py
 
-from PySide6.QtCore import Qt, QRect, QSize, Signal, QEvent
-from PySide6.QtWidgets import QWidget, QPushButton, QHBoxLayout
-from PySide6.QtGui import QPainter, QIcon, QFont, QPixmap, QColor
+from PySide6.QtCore import Qt, QRect, QSize, Signal, QTimer
+from PySide6.QtWidgets import QWidget, QHBoxLayout
+from PySide6.QtGui import QPainter, QPainterPath, QIcon, QFont, QPixmap, QPixmapCache, QImage, QColor, QRegion
+from PySide6.QtSvg import QSvgRenderer
+from functools import lru_cache
 from pathlib import Path
 
 # Assuming theme_vars is available as in your snippet
 from gui.theme.theme_vars import theme_vars
+from gui.startup.widgets.hover_button import HoverButton
 
 CURRENT_DIR = Path(__file__).resolve().parent
 # Adjust path if necessary based on your actual project structure
 ICONS_DIR = CURRENT_DIR.parent.parent.parent / "gui" / "assets" / "icons"
 
+# Icons are validated once at import; lookups at runtime never touch the disk.
+# Paths are stored as ready-made strings for QSvgRenderer.
+_AVAILABLE_ICONS = {
+    name: str(path)
+    for name, path in ((n, ICONS_DIR / n) for n in ("light.svg", "timer.svg", "shutter.svg"))
+    if path.exists()
+}
+
+
+@lru_cache(maxsize=None)
+def _icon_renderer(name):
+    """
+    Returns a shared QSvgRenderer for an icon (parsed once per process),
+    or None if the icon is missing or invalid.
+    """
+    path = _AVAILABLE_ICONS.get(name)
+    if path is None:
+        return None
+    renderer = QSvgRenderer(path)
+    return renderer if renderer.isValid() else None
+
+
+def _rounded_shape(rect, radius):
+    """
+    Precomputes what _fill_rounded needs for a rounded rect:
+    the outline path, the straight (axis-aligned) bands and the corner region.
+    """
+    x, y, w, h = rect.x(), rect.y(), rect.width(), rect.height()
+
+    path = QPainterPath()
+    if rect.isEmpty():
+        return path, (), QRegion()
+    path.addRoundedRect(rect, radius, radius)
+
+    # A full-height centre band and two side bands
+    bands = (
+        QRect(x + radius, y, w - 2 * radius, h),
+        QRect(x, y + radius, radius, h - 2 * radius),
+        QRect(x + w - radius, y + radius, radius, h - 2 * radius),
+    )
+
+    corners = QRegion()
+    for cx, cy in ((x, y), (x + w - radius, y), (x, y + h - radius), (x + w - radius, y + h - radius)):
+        corners += QRect(cx, cy, radius, radius)
+
+    return path, bands, corners
+
+
+def _fill_rounded(p, shape, color):
+    """
+    Fills a shape from _rounded_shape, antialiasing only the four curved corners.
+    The straight bands in between are axis-aligned, so they are filled
+    without AA (much cheaper per pixel).
+    """
+    path, bands, corners = shape
+
+    p.setRenderHint(QPainter.Antialiasing, False)
+    for band in bands:
+        p.fillRect(band, color)
+
+    # Curved corners only
+    p.setRenderHint(QPainter.Antialiasing, True)
+    p.setClipRegion(corners)
+    p.fillPath(path, color)
+    p.setClipping(False)
+
 
 class ShutterBar(QWidget):
     # Signals
@@ -23,75 +92,126 @@ class ShutterBar(QWidget):
 
     hoverStatus = Signal(str)
 
+    _TIMER_TOOLTIPS = {0: "Timer: Off", 2: "Timer: 2s", 3: "Timer: 3s", 5: "Timer: 5s"}
+
     def __init__(self, initial_timer=0, parent=None):
         super().__init__(parent)
 
         self.setFixedSize(300, 80)
 
+        # paintEvent draws its own background, so skip Qt's background erase.
+        # Not WA_OpaquePaintEvent: the pill corners (and review mode) leave
+        # pixels unpainted that must show the parent through.
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+
         # ---- State ----
         self.is_review = False
         self._shutter_pressed = False
-        self._timer_value = initial_timer
         self._timer_options = [0, 2, 3, 5]
+        self._timer_idx = (
+            self._timer_options.index(initial_timer)
+            if initial_timer in self._timer_options else 0
+        )
+        self._timer_value = self._timer_options[self._timer_idx]
+
+        # ---- Hover status ----
+        # Leave/Enter pairs from moving between adjacent buttons arrive
+        # back to back; a short single-shot timer folds them into one emit.
+        self._last_hover = ""
+        self._pending_hover = ""
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(10)
+        self._hover_timer.timeout.connect(self._flush_hover)
+
+        # ---- Geometry (real values are set in resizeEvent) ----
+        self._last_size = QSize()
+        self.shutter_rect = QRect()
+        self.timer_rect = QRect()
+        self._bar_shape = _rounded_shape(QRect(), 40)
+        self._shutter_shape = _rounded_shape(QRect(), 32)
+        self._timer_shape = _rounded_shape(QRect(), 18)
+
+        # Pre-rendered bar background, rebuilt when size, DPR or color change
+        self._chrome_pixmap = QPixmap()
+        self._chrome_key = None
 
         # --------------------------------------------------
         # Capture buttons
         # --------------------------------------------------
 
+        # Each button reports its own hover text (see HoverButton)
+
         # 1. Flash / Light Button
-        self.light_btn = QPushButton(self)
+        self.light_btn = HoverButton("Screen Flash", self)
         self.light_btn.setCheckable(True)
         self.light_btn.setIconSize(QSize(24, 24))
         self.light_btn.clicked.connect(self._on_light_clicked)
-        self.light_btn.installEventFilter(self)
+        self.light_btn.hovered.connect(self._set_hover)
 
         # 2. Shutter Button
-        self.shutter_btn = QPushButton(self)
+        self.shutter_btn = HoverButton("Capture", self)
         self.shutter_btn.setIconSize(QSize(42, 42))
         self.shutter_btn.pressed.connect(self._on_shutter_press)
         self.shutter_btn.released.connect(self._on_shutter_release)
-        self.shutter_btn.clicked.connect(self.shutterClicked.emit)
-        self.shutter_btn.installEventFilter(self)
+        self.shutter_btn.clicked.connect(self.shutterClicked)
+        self.shutter_btn.hovered.connect(self._set_hover)
 
         # 3. Timer Button
-        self.timer_btn = QPushButton(self)
+        self.timer_btn = HoverButton(self._TIMER_TOOLTIPS[self._timer_value], self)
         self.timer_btn.clicked.connect(self._toggle_timer)
-        self.timer_btn.installEventFilter(self)
-        
-        # Placeholder for the timer icon (loaded in _apply_icon_theme)
-        self._timer_icon = QIcon()
-
-        # Set transparency for standard buttons (we paint backgrounds manually)
-        for b in (self.light_btn, self.shutter_btn, self.timer_btn):
-            b.setStyleSheet("background: transparent; border: none;")
-
-        # --------------------------------------------------
-        # Review mode (Save/Discard)
-        # --------------------------------------------------
-
-        self.review_container = QWidget(self)
-        review_layout = QHBoxLayout(self.review_container)
-        review_layout.setContentsMargins(0, 0, 0, 0)
-        review_layout.setSpacing(60)
-
-        self.btn_retake = QPushButton("✗")
-        self.btn_save = QPushButton("✓")
-
-        for b in (self.btn_retake, self.btn_save):
-            b.setFixedSize(54, 54)
-            b.installEventFilter(self)
-
-        self.btn_retake.clicked.connect(self.retakeClicked.emit)
-        self.btn_save.clicked.connect(self.saveClicked.emit)
+        self.timer_btn.hovered.connect(self._set_hover)
+
+        # Pre-rasterized timer icon (loaded in _apply_icon_theme), drawn directly in paintEvent
+        self._timer_pixmap = QPixmap()
+        # DPR the icon pixmaps were rendered at (rebuilt when it changes)
+        self._icons_dpr = 0.0
+
+        # Rendered SVG alpha masks, keyed by (icon_name, size, dpr)
+        self._svg_cache = {}
+
+        # Fonts used by paintEvent
+        self._timer_font = QFont()
+        self._timer_font.setBold(True)
+        self._timer_font.setPointSize(11)
+
+        # Bar paint colors, resolved on the first paint after each theme change
+        self._paint_colors = None
+
+        # Review button colors (bg, hover bg, glyph), filled in by the theme rebuild
+        self._retake_colors = None
+        self._save_colors = None
+        self._review_font = QFont()
+        self._review_font.setPixelSize(24)
+        self._review_font.setBold(True)
+
+        # Theme rebuilds are coalesced onto the next event loop tick
+        self._icon_rebuild_pending = False
+        self._review_rebuild_pending = False
+        # Icons are generated on first show, not at construction
+        self._icons_ready = False
+
+        # Set transparency for all buttons (we paint backgrounds manually).
+        # One stylesheet on the bar, scoped by object name, is parsed once
+        # and also covers the review buttons created later.
+        self.light_btn.setObjectName("lightBtn")
+        self.shutter_btn.setObjectName("shutterBtn")
+        self.timer_btn.setObjectName("timerBtn")
+        self.setStyleSheet(
+            "QPushButton#lightBtn, QPushButton#shutterBtn, QPushButton#timerBtn,"
+            " QPushButton#retakeBtn, QPushButton#saveBtn"
+            " { background: transparent; border: none; }"
+        )
 
-        review_layout.addWidget(self.btn_retake)
-        review_layout.addWidget(self.btn_save)
+        # Review mode widgets are built on first use (see _ensure_review_widgets)
+        self.review_container = None
+        self.btn_retake = None
+        self.btn_save = None
 
         self.setReviewMode(False)
 
-        # Theme Initialization
-        self._apply_icon_theme()
-        self._apply_review_button_theme()
+        # Theme Initialization (icons are built in showEvent)
+        theme_vars().themeChanged.connect(self.update_theme)
 
     # --------------------------------------------------
     # Helpers
@@ -103,143 +223,281 @@ class ShutterBar(QWidget):
     def get_timer_value(self):
         return self._timer_value
         
-    def _create_colored_icon(self, icon_name, qcolor):
+    def _render_svg(self, icon_name, size):
+        """
+        Renders an SVG once at its display size and the current DPR.
+        Returns the alpha mask (cached), or a null QImage if it can't be loaded.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (icon_name, size, dpr)
+        if key in self._svg_cache:
+            return self._svg_cache[key]
+
+        mask = QImage()
+        renderer = _icon_renderer(icon_name)
+        if renderer is not None:
+            image = QImage(QSize(size, size) * dpr, QImage.Format_ARGB32_Premultiplied)
+            image.fill(Qt.transparent)
+            painter = QPainter(image)
+            renderer.render(painter)
+            painter.end()
+            mask = image.convertToFormat(QImage.Format_Alpha8)
+
+        self._svg_cache[key] = mask
+        return mask
+
+    def _create_colored_pixmap(self, icon_name, qcolor, size):
         """
         Loads an SVG and repaints it with the given QColor.
         This fixes the issue where icons ignore CSS color properties.
+        Results are shared across widgets through QPixmapCache.
         """
-        path = ICONS_DIR / icon_name
-        if not path.exists():
-            return QIcon()
-
-        # Load original
-        pixmap = QPixmap(str(path))
-        if pixmap.isNull():
-            return QIcon()
-
-        # Create a new transparent pixmap of the same size
-        colored_pixmap = QPixmap(pixmap.size())
-        colored_pixmap.fill(Qt.transparent)
-
-        # Paint
-        painter = QPainter(colored_pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        
-        # Draw the mask (original icon)
-        painter.drawPixmap(0, 0, pixmap)
-        
-        # Fill with color using SourceIn (keeps alpha, changes color)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        painter.fillRect(colored_pixmap.rect(), qcolor)
-        painter.end()
-
-        return QIcon(colored_pixmap)
-
-    # --------------------------------------------------
-    # Hover tooltips
-    # --------------------------------------------------
-
-    def eventFilter(self, obj, event):
-        if event.type() == QEvent.Enter:
-            if obj == self.light_btn:
-                self.hoverStatus.emit("Screen Flash")
-            elif obj == self.shutter_btn:
-                self.hoverStatus.emit("Capture")
-            elif obj == self.timer_btn:
-                status = "Timer: Off" if self._timer_value == 0 else f"Timer: {self._timer_value}s"
-                self.hoverStatus.emit(status)
-            elif obj == self.btn_save:
-                self.hoverStatus.emit("Save Photo")
-            elif obj == self.btn_retake:
-                self.hoverStatus.emit("Discard & Retake")
-
-        elif event.type() == QEvent.Leave:
-            self.hoverStatus.emit("")
-
-        return super().eventFilter(obj, event)
+        dpr = self.devicePixelRatioF()
+        key = f"shutter_bar:{icon_name}:{size}:{qcolor.rgba():08x}:{dpr}"
+        pm = QPixmapCache.find(key)
+        if pm is not None:
+            return pm
+
+        mask = self._render_svg(icon_name, size)
+        if mask.isNull():
+            return QPixmap()
+
+        # Solid color image that takes its alpha from the original icon
+        # (keeps the antialiased edges, no second painter pass)
+        colored = QImage(mask.size(), QImage.Format_ARGB32_Premultiplied)
+        colored.fill(qcolor)
+        colored.setAlphaChannel(mask)
+        colored.setDevicePixelRatio(dpr)
+
+        pm = QPixmap.fromImage(colored)
+        QPixmapCache.insert(key, pm)
+        return pm
 
     # --------------------------------------------------
     # Layout
     # --------------------------------------------------
 
+    def showEvent(self, event):
+        # Build icons lazily so the SVG work stays out of construction.
+        # They are queued for the next event loop tick rather than built here,
+        # which keeps the SVG rasterization out of the show/first-paint path.
+        if not self._icons_ready:
+            self._icons_ready = True
+            self._apply_icon_theme()
+            self._apply_review_button_theme()
+        super().showEvent(event)
+
     def resizeEvent(self, event):
-        h, w = self.height(), self.width()
+        # Qt also sends resize events when nothing changed (e.g. on restyle)
+        size = event.size()
+        if size == self._last_size:
+            return
+        self._last_size = size
 
-        self.light_btn.setGeometry(16, (h - 44) // 2, 44, 44)
+        w, h = size.width(), size.height()
+        cx, cy = w // 2, h // 2
 
-        self.timer_rect = QRect(w - 52, (h - 50) // 2, 36, 50)
+        self.light_btn.setGeometry(16, cy - 22, 44, 44)
+
+        self.timer_rect = QRect(w - 52, cy - 25, 36, 50)
         self.timer_btn.setGeometry(self.timer_rect)
 
-        self.shutter_rect = QRect((w - 160) // 2, (h - 64) // 2, 160, 64)
+        self.shutter_rect = QRect(cx - 80, cy - 32, 160, 64)
         self.shutter_btn.setGeometry(self.shutter_rect)
 
-        self.review_container.setGeometry(0, 0, w, h)
+        # Pill geometry only changes here, so build it once for paintEvent
+        self._bar_shape = _rounded_shape(self.rect(), 40)
+        self._shutter_shape = _rounded_shape(self.shutter_rect, 32)
+        self._timer_shape = _rounded_shape(self.timer_rect, 18)
+
+        if self.review_container is not None:
+            self.review_container.setGeometry(0, 0, w, h)
 
     # --------------------------------------------------
     # Paint
     # --------------------------------------------------
 
     def paintEvent(self, event):
-        if self.is_review:
-            return
+        # Moved to a screen with a different scale: re-render the icons
+        if self._icons_ready and self.devicePixelRatioF() != self._icons_dpr:
+            self._apply_icon_theme()
 
-        v = theme_vars()
         p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing)
         p.setPen(Qt.NoPen)
 
+        # Only redraw the sections inside the dirty region
+        dirty = event.region()
+
+        if self.is_review:
+            self._paint_review(p, dirty)
+            return
+
+        c = self._paint_colors or self._resolve_paint_colors()
+
         # 1. Bar background
-        p.setBrush(v.qcolor("surface_container"))
-        p.drawRoundedRect(self.rect(), 40, 40)
+        p.drawPixmap(0, 0, self._chrome(c["bg"]))
 
         # 2. Shutter Background
         # Changes color slightly when pressed
-        shutter_color = v.qcolor("primary_fixed_dim") if self._shutter_pressed else v.qcolor("primary")
-        p.setBrush(shutter_color)
-        p.drawRoundedRect(self.shutter_rect, 32, 32)
+        if dirty.intersects(self.shutter_rect):
+            shutter_color = c["shutter_down"] if self._shutter_pressed else c["shutter_up"]
+            _fill_rounded(p, self._shutter_shape, shutter_color)
 
         # 3. Flash glow (only when ON)
-        if self.light_btn.isChecked():
-            glow = self.light_btn.geometry().adjusted(-4, -4, 4, 4)
-            p.setBrush(v.rgba("primary", 0.25))
+        # The ellipse is curved all around, so it keeps AA.
+        glow = self.light_btn.geometry().adjusted(-4, -4, 4, 4)
+        if self.light_btn.isChecked() and dirty.intersects(glow):
+            p.setRenderHint(QPainter.Antialiasing, True)
+            p.setBrush(c["glow"])
             p.drawEllipse(glow)
 
+        if not dirty.intersects(self.timer_rect):
+            return
+
         # 4. Timer Background
         active = self._timer_value > 0
-        p.setBrush(
-            v.qcolor("surface_container_high")
-            if active else v.qcolor("surface_container_low")
-        )
-        p.drawRoundedRect(self.timer_rect, 18, 18)
+        _fill_rounded(p, self._timer_shape, c["timer_on_bg"] if active else c["timer_off_bg"])
 
         # 5. Timer Content (Text or Icon)
         if active:
-            p.setPen(v.qcolor("primary"))
-            font = QFont()
-            font.setBold(True)
-            font.setPointSize(11)
-            p.setFont(font)
+            p.setPen(c["timer_on_fg"])
+            p.setFont(self._timer_font)
             p.drawText(self.timer_rect, Qt.AlignCenter, f"{self._timer_value}s")
         else:
-            # Draw the colorized icon we prepared in _apply_icon_theme
+            # Draw the pixmap we prepared in _apply_icon_theme
+            # (drawPixmap skips QIcon's engine lookup on every repaint)
             icon_rect = QRect(
                 self.timer_rect.center().x() - 10,
                 self.timer_rect.center().y() - 10,
                 20,
                 20,
             )
-            self._timer_icon.paint(p, icon_rect, Qt.AlignCenter)
+            p.drawPixmap(icon_rect.topLeft(), self._timer_pixmap)
+
+    def _chrome(self, color):
+        """
+        Returns the bar background as a cached pixmap.
+        It only changes on resize, DPR or theme change, so paintEvent
+        blits it instead of re-rasterizing the antialiased pill.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr, color.rgba())
+        if key != self._chrome_key:
+            pm = QPixmap(self.size() * dpr)
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.transparent)
+
+            cp = QPainter(pm)
+            cp.setPen(Qt.NoPen)
+            _fill_rounded(cp, self._bar_shape, color)
+            cp.end()
+
+            self._chrome_pixmap = pm
+            self._chrome_key = key
+        return self._chrome_pixmap
+
+    def _ensure_review_widgets(self):
+        """
+        Builds the review mode (Save/Discard) widgets the first time they
+        are needed; many capture sessions never enter review mode.
+        """
+        if self.review_container is not None:
+            return
+
+        self.review_container = QWidget(self)
+        review_layout = QHBoxLayout(self.review_container)
+        review_layout.setContentsMargins(0, 0, 0, 0)
+        review_layout.setSpacing(60)
+
+        # Invisible hit targets; the circles and glyphs are drawn in paintEvent
+        self.btn_retake = HoverButton("Discard & Retake")
+        self.btn_save = HoverButton("Save Photo")
+        self.btn_retake.setObjectName("retakeBtn")
+        self.btn_save.setObjectName("saveBtn")
+
+        for b in (self.btn_retake, self.btn_save):
+            b.setFixedSize(54, 54)
+            b.hovered.connect(self._set_hover)
+            # Repaint the circle for the hover color
+            b.hovered.connect(lambda _, b=b: self.update(b.geometry()))
+
+        self.btn_retake.clicked.connect(self.retakeClicked)
+        self.btn_save.clicked.connect(self.saveClicked)
+
+        review_layout.addWidget(self.btn_retake)
+        review_layout.addWidget(self.btn_save)
+
+        self.review_container.setGeometry(self.rect())
+
+    def _paint_review(self, p, dirty):
+        """Draws the Retake/Save circles behind their transparent buttons."""
+        p.setRenderHint(QPainter.Antialiasing, True)
+        p.setFont(self._review_font)
+
+        for btn, glyph, colors in (
+            (self.btn_retake, "✗", self._retake_colors),
+            (self.btn_save, "✓", self._save_colors),
+        ):
+            rect = btn.geometry()
+            if colors is None or not dirty.intersects(rect):
+                continue
+
+            bg, hover_bg, fg = colors
+            p.setPen(Qt.NoPen)
+            p.setBrush(hover_bg if btn.underMouse() else bg)
+            p.drawEllipse(rect)
+
+            p.setPen(fg)
+            p.drawText(rect, Qt.AlignCenter, glyph)
 
     # --------------------------------------------------
     # Theme helpers
     # --------------------------------------------------
 
+    def _resolve_paint_colors(self):
+        """
+        Resolves the bar's paint colors from the theme once and keeps them
+        until the next theme change, so paintEvent does no color lookups.
+        """
+        v = theme_vars()
+        self._paint_colors = {
+            "bg": v.qcolor("surface_container"),
+            "shutter_up": v.qcolor("primary"),
+            "shutter_down": v.qcolor("primary_fixed_dim"),
+            "glow": v.rgba("primary", 0.25),
+            "timer_on_bg": v.qcolor("surface_container_high"),
+            "timer_off_bg": v.qcolor("surface_container_low"),
+            "timer_on_fg": v.qcolor("primary"),
+        }
+        return self._paint_colors
+
+    def update_theme(self):
+        """Refreshes icons and review buttons after a theme change."""
+        self._paint_colors = None
+        if not self._icons_ready:
+            # Not shown yet; showEvent will build them with the new theme
+            return
+        self._apply_icon_theme()
+        self._apply_review_button_theme()
+        self.update()
+
     def _apply_icon_theme(self):
+        """
+        Schedules an icon rebuild on the next event loop tick.
+        Call this when the theme changes; repeated calls before the
+        rebuild runs collapse into one.
+        """
+        if self._icon_rebuild_pending:
+            return
+        self._icon_rebuild_pending = True
+        QTimer.singleShot(0, self._do_icon_rebuild)
+
+    def _do_icon_rebuild(self):
         """
         Regenerates all icons using the current theme colors.
-        Call this when theme changes or button states change (like Flash ON/OFF).
         """
+        self._icon_rebuild_pending = False
+        self._icons_dpr = self.devicePixelRatioF()
         v = theme_vars()
 
         # Define colors
@@ -249,89 +507,106 @@ class ShutterBar(QWidget):
         color_on_primary = v.qcolor("on_primary")
 
         # 1. Light Button Icon
-        # If checked, use active color; otherwise inactive color.
-        flash_color = color_active if self.light_btn.isChecked() else color_inactive
-        self.light_btn.setIcon(self._create_colored_icon("light.svg", flash_color))
+        # Off = inactive color, On (checked) = active color; Qt picks the
+        # pixmap from the button's checked state, so toggling needs no rebuild.
+        light_off = self._create_colored_pixmap("light.svg", color_inactive, 24)
+        light_on = self._create_colored_pixmap("light.svg", color_active, 24)
+        light_icon = QIcon()
+        for mode in (QIcon.Normal, QIcon.Active):
+            light_icon.addPixmap(light_off, mode, QIcon.Off)
+            light_icon.addPixmap(light_on, mode, QIcon.On)
+        self.light_btn.setIcon(light_icon)
 
         # 2. Timer Icon (used in paintEvent)
         # Always use the inactive color for the "off" state icon
-        self._timer_icon = self._create_colored_icon("timer.svg", color_inactive)
-        
+        self._timer_pixmap = self._create_colored_pixmap("timer.svg", color_inactive, 20)
+
         # 3. Shutter Icon
-        self.shutter_btn.setIcon(self._create_colored_icon("shutter.svg", color_on_primary))
+        # (rendered at the SVG's native 24px; QIcon never upscaled it to 42)
+        self.shutter_btn.setIcon(QIcon(self._create_colored_pixmap("shutter.svg", color_on_primary, 24)))
 
         # Trigger a repaint to show changes
         self.update()
 
     def _apply_review_button_theme(self):
         """
-        Applies CSS to the review (Save/Retake) buttons.
-        These use standard background colors, so stylesheets work fine here.
+        Schedules the review button restyle on the next event loop tick.
+        """
+        if self._review_rebuild_pending:
+            return
+        self._review_rebuild_pending = True
+        QTimer.singleShot(0, self._do_review_button_rebuild)
+
+    def _do_review_button_rebuild(self):
+        """
+        Caches the review (Save/Retake) button colors used by paintEvent.
         """
+        self._review_rebuild_pending = False
         v = theme_vars()
 
-        self.btn_save.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {v["primary"]};
-                color: {v["on_primary"]};
-                border-radius: 27px;
-                font-size: 24px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {v["primary_container"]};
-            }}
-        """)
-
-        self.btn_retake.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {v["surface_container_low"]};
-                color: {v["on_surface"]};
-                border-radius: 27px;
-                font-size: 24px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {v["surface_container"]};
-            }}
-        """)
+        self._save_colors = (
+            v.qcolor("primary"),
+            v.qcolor("primary_container"),
+            v.qcolor("on_primary"),
+        )
+        self._retake_colors = (
+            v.qcolor("surface_container_low"),
+            v.qcolor("surface_container"),
+            v.qcolor("on_surface"),
+        )
+
+        if self.is_review:
+            self.update()
 
     # --------------------------------------------------
     # State changes
     # --------------------------------------------------
 
     def setReviewMode(self, review: bool):
+        if review:
+            self._ensure_review_widgets()
+
         self.is_review = review
         self.light_btn.setVisible(not review)
         self.shutter_btn.setVisible(not review)
         self.timer_btn.setVisible(not review)
-        self.review_container.setVisible(review)
+        if self.review_container is not None:
+            self.review_container.setVisible(review)
         self.update()
 
+    def _set_hover(self, text):
+        self._pending_hover = text
+        self._hover_timer.start()
+
+    def _flush_hover(self):
+        # Only tell listeners when the status text actually changed
+        if self._pending_hover != self._last_hover:
+            self._last_hover = self._pending_hover
+            self.hoverStatus.emit(self._last_hover)
+
     def _toggle_timer(self):
-        i = self._timer_options.index(self._timer_value)
-        self._timer_value = self._timer_options[(i + 1) % len(self._timer_options)]
+        self._timer_idx = (self._timer_idx + 1) % len(self._timer_options)
+        self._timer_value = self._timer_options[self._timer_idx]
         self.timerChanged.emit(self._timer_value)
 
+        status = self._TIMER_TOOLTIPS[self._timer_value]
+        self.timer_btn.setHoverText(status)
+
         # Update toast immediately if hovering
         if self.timer_btn.underMouse():
-            status = "Timer: Off" if self._timer_value == 0 else f"Timer: {self._timer_value}s"
-            self.hoverStatus.emit(status)
+            self._set_hover(status)
 
-        self.update()
+        self.update(self.timer_rect)
 
     def _on_shutter_press(self):
         self._shutter_pressed = True
-        self.update()
+        self.update(self.shutter_rect)
 
     def _on_shutter_release(self):
         self._shutter_pressed = False
-        self.update()
+        self.update(self.shutter_rect)
 
     def _on_light_clicked(self):
-        # Update icon color (Active vs Inactive)
-        self._apply_icon_theme()
-        
-        # Emit signal
+        # The icon switches color on its own (QIcon.On/Off states)
         self.lightToggled.emit(self.light_btn.isChecked())
-        self.update()
\ No newline at end of file
+        self.update(self.light_btn.geometry().adjusted(-8, -8, 8, 8))
\ No newline at end of file
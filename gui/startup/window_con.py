@@ -1,4 +1,6 @@
 # gui/startup/window_con.py
+from functools import lru_cache
+
 from PySide6.QtCore import Qt, QObject, QEvent
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -12,6 +14,64 @@ from PySide6.QtWidgets import (
 from gui.theme.theme_vars import theme_vars
 
 
+# --------------------------------------------------
+# Stylesheet builders
+# Cached on the actual color values, so every window sharing a theme
+# reuses the same strings and a theme switch simply misses the cache.
+# --------------------------------------------------
+
+def _theme_colors(vars, *keys):
+    """Hashable snapshot of the given theme tokens."""
+    return frozenset(vars.resolve_many(keys).items())
+
+
+@lru_cache(maxsize=8)
+def _build_root_css(colors):
+    c = dict(colors)
+    return f"""
+        QWidget#root {{
+            background-color: {c["background"]};
+            border-radius: 12px;
+            border: 2px solid {c["outline_variant"]};
+        }}
+    """
+
+
+@lru_cache(maxsize=8)
+def _build_title_css(colors):
+    c = dict(colors)
+    return f"""
+        QLabel {{
+            color: {c["on_surface"]};
+            font-size: 14px;
+            font-weight: 600;
+        }}
+    """
+
+
+@lru_cache(maxsize=8)
+def _build_close_css(colors):
+    c = dict(colors)
+    return f"""
+        QPushButton {{
+            background-color: transparent;
+            border: 2px solid {c["outline_variant"]};
+            border-radius: 10px;
+            color: {c["on_surface_variant"]};
+            font-weight: bold;
+            font-size: 14px;
+        }}
+        QPushButton:hover {{
+            border: 2px solid {c["error"]};
+            color: {c["error"]};
+        }}
+        QPushButton:pressed {{
+            background-color: {c["error_container"]};
+            color: {c["inverse_on_surface"]};
+        }}
+    """
+
+
 class DragFilter(QObject):
     """Allows dragging the frameless window."""
     def __init__(self, window):
@@ -20,16 +80,19 @@ class DragFilter(QObject):
         self._drag_offset = None
 
     def eventFilter(self, obj, event):
-        if event.type() == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
-            self._drag_offset = event.position().toPoint()
-            return False
+        etype = event.type()
 
-        elif event.type() == QEvent.MouseMove and self._drag_offset and event.buttons() & Qt.LeftButton:
-            global_pos = obj.mapToGlobal(event.position().toPoint())
-            self._window.move(global_pos - self._drag_offset)
+        # Moves are by far the most frequent event; bail out early when not dragging
+        if etype == QEvent.MouseMove:
+            if self._drag_offset is not None and event.buttons() & Qt.LeftButton:
+                global_pos = obj.mapToGlobal(event.position().toPoint())
+                self._window.move(global_pos - self._drag_offset)
             return False
 
-        elif event.type() == QEvent.MouseButtonRelease:
+        if etype == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
+            self._drag_offset = event.position().toPoint()
+
+        elif etype == QEvent.MouseButtonRelease:
             self._drag_offset = None
 
         return False
@@ -46,21 +109,11 @@ class BaseFramelessWindow(QMainWindow):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.resize(width, height)
 
-        vars = theme_vars()
-
         # Root
         self._root = QWidget(self)
         self._root.setObjectName("root")
         self.setCentralWidget(self._root)
 
-        self._root.setStyleSheet(f"""
-            QWidget#root {{
-                background-color: {vars["background"]};
-                border-radius: 12px;
-                border: 2px solid {vars["outline_variant"]};
-            }}
-        """)
-
         # Layout
         self._main_layout = QVBoxLayout(self._root)
         self._main_layout.setContentsMargins(12, 8, 12, 12)
@@ -82,44 +135,37 @@ class BaseFramelessWindow(QMainWindow):
         self._content.setStyleSheet("background: transparent;")
         self._main_layout.addWidget(self._content, 1)
 
-    def _init_top_bar(self):
-        vars = theme_vars()
+        # Style now and again on every theme switch, without rebuilding widgets
+        self._apply_theme()
+        theme_vars().themeChanged.connect(self._apply_theme)
 
+    def _init_top_bar(self):
         layout = QHBoxLayout(self._top_bar)
         layout.setContentsMargins(22, 0, 12, 0)
 
-        title = QLabel("Daily Selfie")
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {vars["on_surface"]};
-                font-size: 14px;
-                font-weight: 600;
-            }}
-        """)
-
-        close_btn = QPushButton("✕")
-        close_btn.setFixedSize(32, 32)
-        close_btn.clicked.connect(self.close)
-
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: 2px solid {vars["outline_variant"]};
-                border-radius: 10px;
-                color: {vars["on_surface_variant"]};
-                font-weight: bold;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                border: 2px solid {vars["error"]};
-                color: {vars["error"]};
-            }}
-            QPushButton:pressed {{
-                background-color: {vars["error_container"]};
-                color: {vars["inverse_on_surface"]};
-            }}
-        """)
-
-        layout.addWidget(title)
+        self._title = QLabel("Daily Selfie")
+
+        self._close_btn = QPushButton("✕")
+        self._close_btn.setFixedSize(32, 32)
+        self._close_btn.clicked.connect(self.close)
+
+        layout.addWidget(self._title)
         layout.addStretch()
-        layout.addWidget(close_btn)
+        layout.addWidget(self._close_btn)
+
+    def _apply_theme(self):
+        """Restyles the window chrome from the current theme colors."""
+        vars = theme_vars()
+
+        self._root.setStyleSheet(
+            _build_root_css(_theme_colors(vars, "background", "outline_variant"))
+        )
+        self._title.setStyleSheet(_build_title_css(_theme_colors(vars, "on_surface")))
+        self._close_btn.setStyleSheet(_build_close_css(_theme_colors(
+            vars,
+            "outline_variant",
+            "on_surface_variant",
+            "error",
+            "error_container",
+            "inverse_on_surface",
+        )))
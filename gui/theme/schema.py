@@ -7,6 +7,7 @@ Responsibilities:
 - Detect available modes (dark/light)
 - Detect available contrast levels per mode
 - Ensure minimum required color keys exist
+- Define the Material token aliases used by the app
 
 This module MUST NOT:
 - Modify theme data
@@ -15,7 +16,9 @@ This module MUST NOT:
 """
 
 from __future__ import annotations
-from typing import Dict, List, Set
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 
 
 REQUIRED_COLOR_KEYS = {
@@ -25,6 +28,71 @@ REQUIRED_COLOR_KEYS = {
     "onPrimary",
 }
 
+# Same keys as a tuple: a few direct dict lookups beat set.issubset here
+_REQUIRED_KEYS_TUPLE = tuple(sorted(REQUIRED_COLOR_KEYS))
+
+# --------------------------------------------------
+# Material token aliases (python-style name -> scheme key)
+# --------------------------------------------------
+MATERIAL_ALIASES: Dict[str, str] = {
+    # ===== Primary =====
+    "primary": "primary",
+    "on_primary": "onPrimary",
+    "primary_container": "primaryContainer",
+    "on_primary_container": "onPrimaryContainer",
+
+    # ===== Secondary =====
+    "secondary": "secondary",
+    "on_secondary": "onSecondary",
+    "secondary_container": "secondaryContainer",
+    "on_secondary_container": "onSecondaryContainer",
+
+    # ===== Tertiary =====
+    "tertiary": "tertiary",
+    "on_tertiary": "onTertiary",
+    "tertiary_container": "tertiaryContainer",
+    "on_tertiary_container": "onTertiaryContainer",
+
+    # ===== Fixed =====
+    "primary_fixed": "primaryFixed",
+    "primary_fixed_dim": "primaryFixedDim",
+    "on_primary_fixed": "onPrimaryFixed",
+    "on_primary_fixed_variant": "onPrimaryFixedVariant",
+
+    # ===== Background / Surface =====
+    "background": "background",
+    "on_background": "onBackground",
+
+    "surface": "surface",
+    "on_surface": "onSurface",
+    "surface_variant": "surfaceVariant",
+    "on_surface_variant": "onSurfaceVariant",
+    "surface_dim": "surfaceDim",
+    "surface_bright": "surfaceBright",
+    "surface_container_lowest": "surfaceContainerLowest",
+    "surface_container_low": "surfaceContainerLow",
+    "surface_container": "surfaceContainer",
+    "surface_container_high": "surfaceContainerHigh",
+    "surface_container_highest": "surfaceContainerHighest",
+
+    # ===== Outline / Effects =====
+    "outline": "outline",
+    "outline_variant": "outlineVariant",
+    "scrim": "scrim",
+    "shadow": "shadow",
+
+    # ===== Inverse =====
+    "inverse_surface": "inverseSurface",
+    "inverse_on_surface": "inverseOnSurface",
+    "inverse_primary": "inversePrimary",
+
+    # ===== Error =====
+    "error": "error",
+    "on_error": "onError",
+    "error_container": "errorContainer",
+    "on_error_container": "onErrorContainer",
+}
+
 
 def _extract_schemes(theme: Dict) -> Dict[str, Dict]:
     """
@@ -44,9 +112,34 @@ def _extract_schemes(theme: Dict) -> Dict[str, Dict]:
     }
 
 
+# Mode prefix of a (lowercased) scheme name
+_SCHEME_MODE_RE = re.compile(r"dark|light")
+
+
+@lru_cache(maxsize=64)
+def _classify_scheme(scheme_name: str) -> Optional[Tuple[str, str]]:
+    """
+    Map a scheme name to (mode, contrast), or None if it is not a mode scheme.
+
+    e.g. "dark-high-contrast" -> ("dark", "high"), "light" -> ("light", "standard")
+    """
+    name = scheme_name.lower()
+    m = _SCHEME_MODE_RE.match(name)
+    if not m:
+        return None
+
+    mode = m.group()
+    # "high" wins if a name mentions both
+    if "high" in name:
+        return mode, "high"
+    if "medium" in name:
+        return mode, "medium"
+    return mode, "standard"
+
+
 def _has_required_keys(scheme: Dict) -> bool:
     """Check if a color scheme has minimum required keys."""
-    return REQUIRED_COLOR_KEYS.issubset(scheme.keys())
+    return all(k in scheme for k in _REQUIRED_KEYS_TUPLE)
 
 
 def detect_modes_and_contrasts(theme: Dict) -> Dict[str, List[str]]:
@@ -70,27 +163,15 @@ def detect_modes_and_contrasts(theme: Dict) -> Dict[str, List[str]]:
         if not isinstance(scheme_data, dict):
             continue
 
-        if not _has_required_keys(scheme_data):
+        # Detect mode + contrast
+        classified = _classify_scheme(scheme_name)
+        if classified is None:
             continue
 
-        name = scheme_name.lower()
-
-        # Detect mode
-        if name.startswith("dark"):
-            mode = "dark"
-        elif name.startswith("light"):
-            mode = "light"
-        else:
+        if not _has_required_keys(scheme_data):
             continue
 
-        # Detect contrast
-        if "high" in name:
-            contrast = "high"
-        elif "medium" in name:
-            contrast = "medium"
-        else:
-            contrast = "standard"
-
+        mode, contrast = classified
         availability[mode].add(contrast)
 
     # Convert sets to sorted lists
@@ -108,6 +189,12 @@ def is_theme_usable(theme: Dict) -> bool:
     A theme is usable if it has at least:
     - one mode
     - one contrast level
+
+    i.e. at least one mode scheme with the required keys; stops at the first.
     """
-    availability = detect_modes_and_contrasts(theme)
-    return bool(availability)
+    return any(
+        isinstance(scheme_data, dict)
+        and _classify_scheme(scheme_name) is not None
+        and _has_required_keys(scheme_data)
+        for scheme_name, scheme_data in _extract_schemes(theme).items()
+    )
@@ -11,7 +11,7 @@ Responsibilities:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Add PySide6 imports for Signals
 from PySide6.QtCore import QObject, Signal
@@ -21,7 +21,7 @@ from gui.theme.theme_loader import (
     load_theme_by_name,
     ThemeLoaderError,
 )
-from gui.theme.schema import is_theme_usable, detect_modes_and_contrasts
+from gui.theme.schema import MATERIAL_ALIASES, is_theme_usable
 from gui.theme.theme_model import Theme
 
 from core.config import write_config
@@ -48,6 +48,15 @@ class ThemeController(QObject):
 
         self._theme: Optional[Theme] = None
 
+        # Bumped whenever the active colors change, so consumers can
+        # cache colors() and only refetch after a switch
+        self._generation: int = 0
+        # Alias -> color for the active scheme, built on first use
+        self._flat: Optional[Dict[str, str]] = None
+
+        # Theme objects per name, reused while the loader returns the same raw dict
+        self._theme_cache: Dict[str, Tuple[Dict, Theme]] = {}
+
     # -------------------------------------------------
     # Initialization
     # -------------------------------------------------
@@ -89,18 +98,26 @@ class ThemeController(QObject):
     def _load_theme(self, name: str) -> None:
         raw = load_theme_by_name(self._theme_dir, name)
 
-        if not is_theme_usable(raw):
-            raise ThemeLoaderError(f"Theme '{name}' is not usable")
+        # The loader caches parsed files, so an unchanged file returns the
+        # same dict and the already-built Theme can be reused as is.
+        cached = self._theme_cache.get(name)
+        if cached is not None and cached[0] is raw:
+            theme = cached[1]
+        else:
+            if not is_theme_usable(raw):
+                raise ThemeLoaderError(f"Theme '{name}' is not usable")
+            theme = Theme(raw)
+            self._theme_cache[name] = (raw, theme)
 
-        self._theme = Theme(raw)
+        self._theme = theme
         self._theme_name = name
+        self._colors_changed()
 
-        # Resolve mode/contrast safely
-        availability = detect_modes_and_contrasts(raw)
-        if self._mode not in availability:
-            self._mode = next(iter(availability))
-        if self._contrast not in availability[self._mode]:
-            self._contrast = availability[self._mode][0]
+        # Resolve mode/contrast safely (Theme already detected availability)
+        if not theme.has_mode(self._mode):
+            self._mode = theme.available_modes()[0]
+        if not theme.has_contrast(self._mode, self._contrast):
+            self._contrast = theme.available_contrasts(self._mode)[0]
 
     # -------------------------------------------------
     # Persistence
@@ -126,14 +143,14 @@ class ThemeController(QObject):
     def available_themes(self) -> List[str]:
         return [p.stem for p in list_theme_files(self._theme_dir)]
 
-    def available_modes(self) -> List[str]:
+    def available_modes(self) -> Tuple[str, ...]:
         if not self._theme:
-            return []
+            return ()
         return self._theme.available_modes()
 
-    def available_contrasts(self) -> List[str]:
+    def available_contrasts(self) -> Tuple[str, ...]:
         if not self._theme:
-            return []
+            return ()
         return self._theme.available_contrasts(self._mode)
 
     def set_theme(self, name: str) -> None:
@@ -154,6 +171,7 @@ class ThemeController(QObject):
         if self._theme and self._theme.has_mode(mode):
             if self._mode != mode:
                 self._mode = mode
+                self._colors_changed()
                 self._persist()
                 # Notify the app!
                 self.themeChanged.emit()
@@ -163,15 +181,37 @@ class ThemeController(QObject):
         if self._theme and self._theme.has_contrast(self._mode, contrast):
             if self._contrast != contrast:
                 self._contrast = contrast
+                self._colors_changed()
                 self._persist()
                 # Notify the app!
                 self.themeChanged.emit()
 
+    def generation(self) -> int:
+        """Counter that changes whenever colors() would return different colors."""
+        return self._generation
+
     def colors(self) -> Dict[str, str]:
         if not self._theme:
             return {}
         return self._theme.colors(self._mode, self._contrast)
 
+    def flat_colors(self) -> Dict[str, str]:
+        """
+        Active colors keyed by Material alias (e.g. "on_primary"),
+        with missing tokens already replaced by the fallback color.
+        """
+        if self._flat is None:
+            scheme = self.colors()
+            self._flat = {
+                alias: scheme.get(token) or "#FF00FF"
+                for alias, token in MATERIAL_ALIASES.items()
+            }
+        return self._flat
+
+    def _colors_changed(self) -> None:
+        self._generation += 1
+        self._flat = None
+
     # -------------------------------------------------
     # Introspection
     # -------------------------------------------------
@@ -14,32 +14,73 @@ This module MUST NOT:
 """
 
 from __future__ import annotations
-from typing import Dict, List
+from typing import Dict, FrozenSet, Tuple
 
 from gui.theme.schema import detect_modes_and_contrasts
 
+# Shared "no colors" result, so misses don't allocate (never mutated)
+_EMPTY: Dict[str, str] = {}
+
 
 class Theme:
+    __slots__ = (
+        "_schemes",
+        "_availability",
+        "_modes",
+        "_availability_set",
+        "_has_standard",
+        "_first_contrast",
+        "_scheme_keys",
+        "_colors_cache",
+    )
+
     def __init__(self, raw: Dict):
-        self._raw = raw
-        self._availability = detect_modes_and_contrasts(raw)
+        # Color strings are already interned by the loader
+        self._schemes: Dict[str, Dict[str, str]] = raw.get("schemes") or {}
+        # Tuples, so the availability getters can hand them out without copying
+        self._availability: Dict[str, Tuple[str, ...]] = {
+            mode: tuple(contrasts)
+            for mode, contrasts in detect_modes_and_contrasts(raw).items()
+        }
+        self._modes: Tuple[str, ...] = tuple(self._availability)
+
+        # Membership sets and precomputed fallbacks for _resolve_contrast
+        self._availability_set: Dict[str, FrozenSet[str]] = {
+            mode: frozenset(contrasts) for mode, contrasts in self._availability.items()
+        }
+        self._has_standard: Dict[str, bool] = {
+            mode: "standard" in contrasts for mode, contrasts in self._availability_set.items()
+        }
+        self._first_contrast: Dict[str, str] = {
+            mode: contrasts[0] for mode, contrasts in self._availability.items()
+        }
+
+        # Scheme key for every available (mode, contrast) pair
+        self._scheme_keys: Dict[Tuple[str, str], str] = {
+            (mode, contrast): self._scheme_key(mode, contrast)
+            for mode, contrasts in self._availability.items()
+            for contrast in contrasts
+        }
+
+        # colors() results per requested (mode, contrast), fallbacks included
+        self._colors_cache: Dict[Tuple[str, str], Dict[str, str]] = {}
 
     # -------------------------------------------------
     # Availability
     # -------------------------------------------------
-    def available_modes(self) -> List[str]:
-        """Return available modes (e.g. ['dark', 'light'])."""
-        return list(self._availability.keys())
+    def available_modes(self) -> Tuple[str, ...]:
+        """Return available modes (e.g. ('dark', 'light'))."""
+        return self._modes
 
-    def available_contrasts(self, mode: str) -> List[str]:
+    def available_contrasts(self, mode: str) -> Tuple[str, ...]:
         """Return available contrasts for a given mode."""
-        return self._availability.get(mode, [])
+        return self._availability.get(mode, ())
 
     def has_mode(self, mode: str) -> bool:
         return mode in self._availability
 
     def has_contrast(self, mode: str, contrast: str) -> bool:
-        return contrast in self._availability.get(mode, [])
+        return contrast in self._availability_set.get(mode, ())
 
     # -------------------------------------------------
     # Color Access
@@ -52,13 +93,18 @@ class Theme:
         - If mode not available → use first available mode
         - If contrast not available → use 'standard' or first available
         """
-        mode = self._resolve_mode(mode)
-        contrast = self._resolve_contrast(mode, contrast)
+        cached = self._colors_cache.get((mode, contrast))
+        if cached is not None:
+            return cached
+
+        resolved_mode = self._resolve_mode(mode)
+        resolved_contrast = self._resolve_contrast(resolved_mode, contrast)
 
-        scheme_key = self._scheme_key(mode, contrast)
-        schemes = self._raw.get("schemes", {})
+        scheme_key = self._scheme_keys[(resolved_mode, resolved_contrast)]
+        colors = self._schemes.get(scheme_key, _EMPTY)
 
-        return schemes.get(scheme_key, {})
+        self._colors_cache[(mode, contrast)] = colors
+        return colors
 
     # -------------------------------------------------
     # Internal helpers
@@ -70,12 +116,9 @@ class Theme:
         return next(iter(self._availability))
 
     def _resolve_contrast(self, mode: str, contrast: str) -> str:
-        available = self._availability.get(mode, [])
-        if contrast in available:
+        if contrast in self._availability_set[mode]:
             return contrast
-        if "standard" in available:
-            return "standard"
-        return available[0]
+        return "standard" if self._has_standard[mode] else self._first_contrast[mode]
 
     @staticmethod
     def _scheme_key(mode: str, contrast: str) -> str:
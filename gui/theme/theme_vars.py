@@ -1,113 +1,105 @@
 # gui/theme/theme_vars.py
 from __future__ import annotations
-from typing import Dict
+from typing import Dict, Iterable, Tuple
 
 from PySide6.QtGui import QColor
 from gui.theme.theme_controller import ThemeController
+from gui.theme.schema import MATERIAL_ALIASES
 
 _theme_vars: ThemeVars | None = None
 
 class ThemeVars:
     """
     Material 3 token adapter.
-    FIX: Now fetches live colors from the controller instead of caching them.
+    FIX: Fetches live colors from the controller, refetching whenever its
+    generation() changes instead of caching them forever.
     """
 
+    __slots__ = ("_controller", "_gen", "_colors", "_qcolor_cache", "_rgba_cache")
+
     def __init__(self, controller: ThemeController):
         # CHANGE 1: Store the controller, NOT the colors
         self._controller = controller
 
-        # --------------------------------------------------
-        # Material token aliases
-        # --------------------------------------------------
-        self._map: Dict[str, str] = {
-            # ===== Primary =====
-            "primary": "primary",
-            "on_primary": "onPrimary",
-            "primary_container": "primaryContainer",
-            "on_primary_container": "onPrimaryContainer",
-
-            # ===== Secondary =====
-            "secondary": "secondary",
-            "on_secondary": "onSecondary",
-            "secondary_container": "secondaryContainer",
-            "on_secondary_container": "onSecondaryContainer",
-
-            # ===== Tertiary =====
-            "tertiary": "tertiary",
-            "on_tertiary": "onTertiary",
-            "tertiary_container": "tertiaryContainer",
-            "on_tertiary_container": "onTertiaryContainer",
-
-            # ===== Fixed =====
-            "primary_fixed": "primaryFixed",
-            "primary_fixed_dim": "primaryFixedDim",
-            "on_primary_fixed": "onPrimaryFixed",
-            "on_primary_fixed_variant": "onPrimaryFixedVariant",
-
-            # ===== Background / Surface =====
-            "background": "background",
-            "on_background": "onBackground",
-
-            "surface": "surface",
-            "on_surface": "onSurface",
-            "surface_variant": "surfaceVariant",
-            "on_surface_variant": "onSurfaceVariant",
-            "surface_dim": "surfaceDim",
-            "surface_bright": "surfaceBright",
-            "surface_container_lowest": "surfaceContainerLowest",
-            "surface_container_low": "surfaceContainerLow",
-            "surface_container": "surfaceContainer",
-            "surface_container_high": "surfaceContainerHigh",
-            "surface_container_highest": "surfaceContainerHighest",
-
-            # ===== Outline / Effects =====
-            "outline": "outline",
-            "outline_variant": "outlineVariant",
-            "scrim": "scrim",
-            "shadow": "shadow",
-
-            # ===== Inverse =====
-            "inverse_surface": "inverseSurface",
-            "inverse_on_surface": "inverseOnSurface",
-            "inverse_primary": "inversePrimary",
-
-            # ===== Error =====
-            "error": "error",
-            "on_error": "onError",
-            "error_container": "errorContainer",
-            "on_error_container": "onErrorContainer",
-        }
+        # Alias -> color of the controller generation they were fetched for,
+        # plus QColors built from them (shared, so callers must not mutate them)
+        self._gen = -1
+        self._colors: Dict[str, str] = {}
+        self._qcolor_cache: Dict[str, QColor] = {}
+        self._rgba_cache: Dict[Tuple[str, int], QColor] = {}
 
     # --------------------------------------------------
     # Accessors
     # --------------------------------------------------
     def __getitem__(self, key: str) -> str:
-        token = self._map.get(key)
-        if not token:
-            raise KeyError(f"Unknown Material key: {key}")
-
-        # CHANGE 2: Ask the controller for the CURRENT colors right now
+        # CHANGE 2: Refetch the colors whenever the controller's theme changed
         # This ensures we get Light colors if the mode just changed to Light
-        current_colors = self._controller.colors()
-        
-        value = current_colors.get(token)
-        if not value:
-            # Fallback for missing keys (safety)
-            return "#FF00FF" 
+        if self._controller.generation() != self._gen:
+            self._sync()
 
+        value = self._colors.get(key)
+        if value is None:
+            raise KeyError(f"Unknown Material key: {key}")
         return value
 
     def qcolor(self, key: str) -> QColor:
-        return QColor(self[key])
+        if self._controller.generation() != self._gen:
+            self._sync()
+
+        c = self._qcolor_cache.get(key)
+        if c is None:
+            c = self._qcolor_cache[key] = QColor(self[key])
+        return c
 
     def rgba(self, key: str, alpha: float) -> QColor:
-        c = QColor(self[key])
-        c.setAlphaF(max(0.0, min(1.0, alpha)))
+        if self._controller.generation() != self._gen:
+            self._sync()
+
+        # Quantize to 0..255 first (+0.5 rounds like setAlphaF), then clamp the int
+        a = int(alpha * 255.0 + 0.5)
+        a = 0 if a < 0 else 255 if a > 255 else a
+        c = self._rgba_cache.get((key, a))
+        if c is None:
+            c = QColor(self[key])
+            c.setAlpha(a)
+            self._rgba_cache[(key, a)] = c
         return c
 
+    def _sync(self) -> None:
+        """Drops everything derived from the previous theme's colors."""
+        self._colors = self._controller.flat_colors()
+        self._qcolor_cache = {}
+        self._rgba_cache = {}
+        self._gen = self._controller.generation()
+
+    def resolve_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Colors for several keys at once, e.g. when assembling a stylesheet."""
+        if self._controller.generation() != self._gen:
+            self._sync()
+
+        colors = self._colors
+        try:
+            return {k: colors[k] for k in keys}
+        except KeyError as e:
+            raise KeyError(f"Unknown Material key: {e.args[0]}") from None
+
+    def resolve_format(self, template: str, **extra: str) -> str:
+        """
+        Formats a template whose {placeholders} are Material keys,
+        e.g. "color: {on_surface};". Extra keyword values are available too.
+        """
+        if self._controller.generation() != self._gen:
+            self._sync()
+
+        return template.format_map({**self._colors, **extra} if extra else self._colors)
+
     def keys(self):
-        return self._map.keys()
+        return MATERIAL_ALIASES.keys()
+
+    @property
+    def themeChanged(self):
+        """The controller's themeChanged signal, for widgets that cache theme colors."""
+        return self._controller.themeChanged
 
 
 # ==================================================
@@ -1,26 +1,169 @@
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QPushButton, 
-    QHBoxLayout, QFrame, QGraphicsDropShadowEffect, QTextEdit
+    QHBoxLayout, QFrame, QGraphicsScene, QGraphicsPixmapItem, QGraphicsDropShadowEffect
 )
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QGuiApplication, QColor
+from PySide6.QtCore import Qt, QTimer, QRectF
+from PySide6.QtGui import QGuiApplication, QColor, QImage, QPainter, QPixmap
+from functools import lru_cache
+from string import Template
+
+# Theme Colors
+_LEVEL_COLORS = {
+    "INFO": "#8B5CF6",    # Purple
+    "WARNING": "#F59E0B", # Amber
+    "ERROR": "#EF4444",   # Red
+    "CRITICAL": "#DC2626" # Dark Red
+}
+_DEFAULT_ACCENT = "#EF4444"
+
+_SHADOW_COLORS = {
+    "INFO": QColor(139, 92, 246, 60), # Faint purple glow
+}
+_DEFAULT_SHADOW = QColor(0, 0, 0, 180) # Dark shadow for errors
+
+# Auto-close delay (ms) per level; other levels stay until dismissed
+_AUTOCLOSE_MS = {
+    "INFO": 4000,
+}
+
+# Card stylesheet; only the accent depends on the level
+_CONTAINER_QSS_TPL = Template("""
+    QFrame#Container {
+        background-color: #1A1A1A;
+        
+        /* Fixed Purple Border for Top, Right, Bottom */
+        border: 2px solid #8B5CF6;
+        
+        /* Dynamic Color for Left (Overrides the purple on the left side) */
+        border-left: 4px solid $accent;
+        
+        border-radius: 14px;
+    }
+    QLabel { 
+        color: #E0E0E0; 
+        font-family: sans-serif; 
+        border: none; 
+    }
+    /* Header Title */
+    QLabel#Title {
+        font-weight: bold;
+        font-size: 14px;
+        color: $accent;
+    }
+    /* Message Body */
+    QLabel#Message {
+        color: #CCCCCC;
+        font-size: 13px;
+        margin-top: 4px;
+        margin-bottom: 12px;
+    }
+    /* Action Buttons */
+    QPushButton {
+        background-color: #2D2D2D;
+        color: #B0B0B0;
+        border: 1px solid #333;
+        border-radius: 6px;
+        padding: 6px 12px;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #3D3D3D;
+        color: white;
+        border: 1px solid #555;
+    }
+    /* Primary Action (Dismiss) - Make it Purple */
+    QPushButton#DismissBtn {
+        background-color: #5B21B6; 
+        color: white;
+        border: none;
+    }
+    QPushButton#DismissBtn:hover {
+        background-color: #7C3AED; 
+    }
+""")
+
+
+# The message label grows with its text, so very long messages are
+# shortened for display (Copy Logs still copies full_text)
+_MAX_MESSAGE_LINES = 8
+_MAX_MESSAGE_CHARS = 360
+_MAX_MESSAGE_HEIGHT = 180
+
+
+def _display_message(message):
+    """Message as shown in the toast: at most a few lines, elided with '…'."""
+    lines = message.splitlines()
+    if len(lines) <= _MAX_MESSAGE_LINES and len(message) <= _MAX_MESSAGE_CHARS:
+        return message
+
+    short = "\n".join(lines[:_MAX_MESSAGE_LINES])[:_MAX_MESSAGE_CHARS]
+    return short.rstrip() + "…"
+
+
+# Card shadow (matches the card's 14px corners)
+_SHADOW_BLUR = 25
+_SHADOW_OFFSET_Y = 8
+_CARD_RADIUS = 14
+
+
+@lru_cache(maxsize=8)
+def _shadow_pixmap(width, height, rgba, dpr):
+    """
+    Blurred card silhouette, padded by _SHADOW_BLUR on every side.
+    Rendered once per card size/color and painted behind the card, instead of
+    a QGraphicsDropShadowEffect re-rendering and blurring the whole card on
+    every repaint.
+    """
+    pad = _SHADOW_BLUR
+    size_w, size_h = round((width + 2 * pad) * dpr), round((height + 2 * pad) * dpr)
+
+    # The silhouette: only its alpha matters, the effect supplies the color
+    shape = QImage(size_w, size_h, QImage.Format_ARGB32_Premultiplied)
+    shape.fill(Qt.transparent)
+    p = QPainter(shape)
+    p.setRenderHint(QPainter.Antialiasing)
+    p.setPen(Qt.NoPen)
+    p.setBrush(Qt.black)
+    p.scale(dpr, dpr)
+    p.drawRoundedRect(QRectF(pad, pad, width, height), _CARD_RADIUS, _CARD_RADIUS)
+    p.end()
+
+    # One-off run of the same drop shadow effect the card used to carry.
+    # The shadow is pushed a full image height below the silhouette so
+    # the two don't overlap; the shadow half is then cut out.
+    item = QGraphicsPixmapItem(QPixmap.fromImage(shape))
+    shadow = QGraphicsDropShadowEffect()
+    # (the old effect applied its radius in device pixels, so no dpr scaling)
+    shadow.setBlurRadius(_SHADOW_BLUR)
+    shadow.setColor(QColor.fromRgba(rgba))
+    shadow.setOffset(0, size_h)
+    item.setGraphicsEffect(shadow)
+    scene = QGraphicsScene()
+    scene.addItem(item)
+
+    rendered = QImage(size_w, 2 * size_h, QImage.Format_ARGB32_Premultiplied)
+    rendered.fill(Qt.transparent)
+    p = QPainter(rendered)
+    scene.render(p, QRectF(0, 0, size_w, 2 * size_h), QRectF(0, 0, size_w, 2 * size_h))
+    p.end()
+    blurred = rendered.copy(0, size_h, size_w, size_h)
+
+    pixmap = QPixmap.fromImage(blurred)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+@lru_cache(maxsize=8)
+def _qss_for(level):
+    """Container stylesheet for a level, built once so repeat toasts reuse the same string."""
+    return _CONTAINER_QSS_TPL.substitute(accent=_LEVEL_COLORS.get(level, _DEFAULT_ACCENT))
+
 
 class ErrorToast(QDialog):
     def __init__(self, parent=None, level="ERROR", message="", traceback=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground) # Transparent window for shadow support
-        
-        # Theme Colors
-        level_colors = {
-            "INFO": "#8B5CF6",    # Purple
-            "WARNING": "#F59E0B", # Amber
-            "ERROR": "#EF4444",   # Red
-            "CRITICAL": "#DC2626" # Dark Red
-        }
-        accent_color = level_colors.get(level, "#EF4444")
-        
-        self.full_text = f"[{level}] {message}\n\n{traceback if traceback else ''}"
 
         # 1. Main Layout
         main_layout = QVBoxLayout(self)
@@ -29,72 +172,9 @@ class ErrorToast(QDialog):
         # 2. The Visual Container (The Card)
         self.container = QFrame()
         self.container.setObjectName("Container")
-        
-        # Stylesheet
-        self.container.setStyleSheet(f"""
-            QFrame#Container {{
-                background-color: #1A1A1A;
-                
-                /* Fixed Purple Border for Top, Right, Bottom */
-                border: 2px solid #8B5CF6;
-                
-                /* Dynamic Color for Left (Overrides the purple on the left side) */
-                border-left: 4px solid {accent_color};
-                
-                border-radius: 14px;
-            }}
-            QLabel {{ 
-                color: #E0E0E0; 
-                font-family: sans-serif; 
-                border: none; 
-            }}
-            /* Header Title */
-            QLabel#Title {{
-                font-weight: bold;
-                font-size: 14px;
-                color: {accent_color};
-            }}
-            /* Message Body */
-            QLabel#Message {{
-                color: #CCCCCC;
-                font-size: 13px;
-                margin-top: 4px;
-                margin-bottom: 12px;
-            }}
-            /* Action Buttons */
-            QPushButton {{
-                background-color: #2D2D2D;
-                color: #B0B0B0;
-                border: 1px solid #333;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                background-color: #3D3D3D;
-                color: white;
-                border: 1px solid #555;
-            }}
-            /* Primary Action (Dismiss) - Make it Purple */
-            QPushButton#DismissBtn {{
-                background-color: #5B21B6; 
-                color: white;
-                border: none;
-            }}
-            QPushButton#DismissBtn:hover {{
-                background-color: #7C3AED; 
-            }}
-        """)
-        
-        # 3. Drop Shadow Effect
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(25)
-        if level == "INFO":
-            shadow.setColor(QColor(139, 92, 246, 60)) # Faint purple glow
-        else:
-            shadow.setColor(QColor(0, 0, 0, 180)) # Dark shadow for errors
-        shadow.setOffset(0, 8)
-        self.container.setGraphicsEffect(shadow)
+
+        # 3. Drop Shadow (painted in paintEvent; color is set per level)
+        self._shadow_color = QColor()
 
         main_layout.addWidget(self.container)
 
@@ -104,28 +184,19 @@ class ErrorToast(QDialog):
         content_layout.setSpacing(4)
         
         # Header
-        lbl_title = QLabel(f"{level.title()}")
-        lbl_title.setObjectName("Title")
-        content_layout.addWidget(lbl_title)
+        self._lbl_title = QLabel()
+        self._lbl_title.setObjectName("Title")
+        content_layout.addWidget(self._lbl_title)
 
         # Message
-        lbl_msg = QTextEdit(message)
-        lbl_msg.setStyleSheet("""QTextEdit {
-                background-color: #1A1A1A;
-                border: 2px solid transparent;
-                border-radius: 8px;
-                padding: 8px;
-                color: #E0E0E0;
-            }
-            QTextEdit:focus {
-                border: 2px solid #333333;
-                background-color: #1F1F1F;
-            }
-        """)
-        lbl_msg.setObjectName("Message")
-        lbl_msg.setReadOnly(True)
-        lbl_msg.setMaximumWidth(320)
-        content_layout.addWidget(lbl_msg)
+        self._lbl_msg = QLabel()
+        self._lbl_msg.setObjectName("Message")
+        self._lbl_msg.setTextFormat(Qt.PlainText)
+        self._lbl_msg.setWordWrap(True)
+        self._lbl_msg.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self._lbl_msg.setMaximumWidth(320)
+        self._lbl_msg.setMaximumHeight(_MAX_MESSAGE_HEIGHT)
+        content_layout.addWidget(self._lbl_msg)
 
         # Buttons
         btn_layout = QHBoxLayout()
@@ -146,9 +217,69 @@ class ErrorToast(QDialog):
         
         content_layout.addLayout(btn_layout)
 
-        # Auto-close for INFO messages only
-        if level in ["INFO"]:
-            QTimer.singleShot(4000, self.accept)
+        # Auto-close timer for levels in _AUTOCLOSE_MS, created on first use.
+        # One timer per toast, so a recycled toast can't be closed by
+        # a timeout left over from its previous message.
+        self._autoclose = None
+
+        self._level = None
+        self._message = ""
+        self._traceback = None
+        self.set_level(level)
+        self.set_message(message)
+        self.set_traceback(traceback)
+
+    # --- Content (also used to recycle a pooled toast) ---
+    def set_level(self, level):
+        if level == self._level:
+            return
+        self._level = level
+        self.container.setStyleSheet(_qss_for(level))
+        self._lbl_title.setText(level.title())
+        self._shadow_color = _SHADOW_COLORS.get(level, _DEFAULT_SHADOW)
+        self.update()
+        self._update_full_text()
+
+    def set_message(self, message):
+        self._message = message
+        self._lbl_msg.setText(_display_message(message))
+        self._update_full_text()
+
+    def set_traceback(self, traceback):
+        self._traceback = traceback
+        self._update_full_text()
+
+    def _update_full_text(self):
+        level, message, traceback = self._level, self._message, self._traceback
+        self.full_text = f"[{level}] {message}\n\n{traceback}" if traceback else f"[{level}] {message}"
+
+    def paintEvent(self, event):
+        card = self.container.geometry()
+        if card.isEmpty():
+            return
+        shadow = _shadow_pixmap(
+            card.width(), card.height(), self._shadow_color.rgba(), self.devicePixelRatioF()
+        )
+        p = QPainter(self)
+        p.drawPixmap(card.x() - _SHADOW_BLUR, card.y() - _SHADOW_BLUR + _SHADOW_OFFSET_Y, shadow)
+
+    # --- Lifecycle ---
+    def showEvent(self, event):
+        delay = _AUTOCLOSE_MS.get(self._level)
+        if delay:
+            if self._autoclose is None:
+                self._autoclose = QTimer(self)
+                self._autoclose.setSingleShot(True)
+                self._autoclose.timeout.connect(self.accept)
+            self._autoclose.start(delay)
+        super().showEvent(event)
+
+    def done(self, result):
+        # Dismissed early (or closed): don't let a pending timeout fire later
+        if self._autoclose is not None:
+            self._autoclose.stop()
+        super().done(result)
+        _release(self)
 
     def copy_to_clipboard(self):
         cb = QGuiApplication.clipboard()
@@ -163,6 +294,53 @@ class ErrorToast(QDialog):
         btn.setText(text)
         btn.setEnabled(True)
 
+
+# --------------------------------------------------
+# Reuse
+# Closed toasts are kept (up to _POOL_SIZE) and refilled by show_error,
+# so repeated errors don't rebuild the widget tree and stylesheets.
+# --------------------------------------------------
+_POOL = []
+_POOL_SIZE = 2
+
+
+def _release(toast):
+    if toast in _POOL or len(_POOL) >= _POOL_SIZE:
+        return
+    # Detach so the toast doesn't die with its old parent while pooled
+    toast.setParent(None, toast.windowFlags())
+    _POOL.append(toast)
+
+
+def show_error(parent=None, level="ERROR", message="", traceback=None, center_in=None):
+    """
+    Shows a toast, reusing a closed one when available, and returns it.
+    If center_in (a QRect in global coordinates) is given, the toast is
+    centered on it before it is shown, so a recycled toast never flashes
+    at its previous position.
+    """
+    if _POOL:
+        toast = _POOL.pop()
+        toast.setParent(parent, toast.windowFlags())
+        toast.set_level(level)
+        toast.set_message(message)
+        toast.set_traceback(traceback)
+        # Recompute the size hints for the new text now (inner layout first),
+        # so adjustSize below can also shrink the toast
+        toast.container.layout().activate()
+        toast.layout().activate()
+    else:
+        toast = ErrorToast(parent, level=level, message=message, traceback=traceback)
+
+    toast.adjustSize()
+    if center_in is not None:
+        toast.move(
+            center_in.x() + (center_in.width() - toast.width()) // 2,
+            center_in.y() + (center_in.height() - toast.height()) // 2,
+        )
+    toast.show()
+    return toast
+
 # Smoke Test
 if __name__ == "__main__":
     from PySide6.QtWidgets import QApplication